@@ -10,14 +10,24 @@ queries an Ollama LLM for each row, and writes the augmented CSV back to disk.
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import csv
+import os
+import sqlite3
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-import pandas as pd
 from tqdm import tqdm
-import subprocess
+
+from llm_client import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_NUM_PREDICT,
+    DEFAULT_OLLAMA_URL,
+    ERROR_CODES,
+    AsyncOllamaClient,
+    open_cache,
+)
 
 BASE_DIR = Path(__file__).resolve().parent
 DEFAULT_INPUT = (
@@ -29,7 +39,9 @@ DEFAULT_INPUT = (
 )
 
 DEFAULT_OUTPUT = BASE_DIR / "aiThroughPut2" / "target_columns_with_notes.csv"
+DEFAULT_CACHE = BASE_DIR / "aiThroughPut2" / "ollama_cache.sqlite"
 DEFAULT_MODEL = "llama3.2"
+DEFAULT_BATCH_SIZE = 1
 DEFAULT_COLUMNS = ["recommendedFredSeries", "reasonsForRecommendation"]
 DEFAULT_INSTRUCTION = (
     "Provide thoughtful, well-structured values for each requested field so analysts "
@@ -48,16 +60,19 @@ def load_instruction(arg_instruction: str | None, prompt_path: Path | None) -> s
     return instruction if instruction else DEFAULT_INSTRUCTION
 
 
-def normalize_cell(value: Any) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, float) and pd.isna(value):
-        return ""
-    text = str(value)
-    return text.strip()
+def normalize_cell(value: str | None) -> str:
+    return (value or "").strip()
+
+
+def load_rows(path: Path) -> tuple[list[str], list[dict[str, str]]]:
+    """Read the input CSV as plain string rows, returning its header and rows."""
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        rows = list(reader)
+        return list(reader.fieldnames or []), rows
 
 
-def build_prompt(row: pd.Series, column_names: list[str], instruction: str) -> str:
+def build_details_block(row: dict[str, str]) -> str:
     details = []
     for field in ["query", "series_id", "title", "frequency", "units", "last_updated"]:
         value = normalize_cell(row.get(field))
@@ -68,94 +83,217 @@ def build_prompt(row: pd.Series, column_names: list[str], instruction: str) -> s
     if notes:
         details.append(f"- notes: {notes}")
 
-    details_block = "\n".join(details) if details else "- No additional metadata supplied."
+    return "\n".join(details) if details else "- No additional metadata supplied."
 
+
+def build_prompt_prefix(column_names: list[str], instruction: str, batched: bool = False) -> str:
+    """Build the row-independent prompt header.
+
+    The header is byte-identical for every request in a run so Ollama can reuse
+    its KV cache for the shared prefix; row data is appended after it.
+    """
     columns_block = "\n".join(f'- "{name}"' for name in column_names)
     json_example = ", ".join(f'"{name}": "..."' for name in column_names)
 
+    if batched:
+        fields_heading = "Requested output fields for every series:"
+        response_format = (
+            f'{{"results": [{{"series": 1, {json_example}}}, ...]}}\n'
+            "with exactly one entry per series, in the order given."
+        )
+    else:
+        fields_heading = "Requested output fields:"
+        response_format = f"{{{json_example}}}"
+
     return f"""You are assisting with economic labor analytics.
 
 We maintain a crosswalk between job tasks and FRED economic indicators.
 
-Series metadata:
-{details_block}
-
 Instruction: {instruction}
 
-Requested output fields:
+{fields_heading}
 {columns_block}
 
 Respond ONLY with valid JSON of the form:
-{{{json_example}}}
+{response_format}
 """
 
 
-def query_ollama(prompt: str, model: str) -> dict[str, Any]:
-    try:
-        result = subprocess.run(
-            ["ollama", "run", model],
-            input=prompt,
-            text=True,
-            capture_output=True,
-            timeout=60,
-            check=False,
-        )
-    except subprocess.TimeoutExpired:
-        return {"error": "TIMEOUT"}
-    except Exception as exc:  # pragma: no cover - defensive
-        return {"error": f"UNEXPECTED_ERROR: {exc}"}
+def build_prompt(row: dict[str, str], prefix: str) -> str:
+    return f"""{prefix}---
+Series metadata:
+{build_details_block(row)}
+"""
 
-    if result.returncode != 0:
-        stderr = (result.stderr or "").strip()
-        return {"error": f"OLLAMA_ERROR: {stderr}"}
 
-    response_text = (result.stdout or "").strip()
-    start = response_text.find("{")
-    end = response_text.rfind("}") + 1
-    if start == -1 or end <= start:
-        return {"error": f"PARSE_ERROR: {response_text}"}
+def build_batch_prompt(rows: list[dict[str, str]], prefix: str) -> str:
+    series_block = "\n\n".join(
+        f"Series {position}:\n{build_details_block(row)}"
+        for position, row in enumerate(rows, start=1)
+    )
 
-    try:
-        return json.loads(response_text[start:end])
-    except json.JSONDecodeError as exc:
-        return {"error": f"JSON_ERROR: {exc}: {response_text}"}
+    return f"""{prefix}---
+Metadata for {len(rows)} series:
 
+{series_block}
+"""
 
-def process_dataframe(
-    df: pd.DataFrame,
-    column_names: list[str],
-    instruction: str,
-    model: str,
-    limit: int | None,
-    overwrite: bool,
-) -> pd.DataFrame:
-    for name in column_names:
-        if name not in df.columns:
-            df[name] = ""
 
-    rows = df.head(limit) if limit else df
+def build_response_schema(column_names: list[str], batched: bool = False) -> dict[str, Any]:
+    """JSON schema for Ollama's constrained decoding of the requested fields."""
+    item_schema = {
+        "type": "object",
+        "required": list(column_names),
+        "properties": {name: {"type": "string"} for name in column_names},
+    }
+    if not batched:
+        return item_schema
+
+    item_schema["required"] = ["series", *column_names]
+    item_schema["properties"] = {"series": {"type": "integer"}, **item_schema["properties"]}
+    return {
+        "type": "object",
+        "required": ["results"],
+        "properties": {"results": {"type": "array", "items": item_schema}},
+    }
+
+
+def split_batch_response(response: dict[str, Any], size: int) -> list[dict[str, Any]]:
+    """Fan a multi-series response out into one response dict per series.
+
+    Items are matched to series by their ``series`` number, never by list position.
+    A malformed, out-of-range or duplicated number makes the whole reply
+    untrustworthy, so every series gets a PARSE_ERROR; a series with no item gets
+    its own PARSE_ERROR.
+    """
+    if "error" in response:
+        return [response] * size
+
+    results = response.get("results")
+    if not isinstance(results, list):
+        return [{"error": f"PARSE_ERROR: {response}"}] * size
+
+    responses: list[dict[str, Any] | None] = [None] * size
+    for item in results:
+        series = item.get("series") if isinstance(item, dict) else None
+        if type(series) is not int or not 1 <= series <= size:
+            return [{"error": f"PARSE_ERROR: invalid series number in {item}"}] * size
+        if responses[series - 1] is not None:
+            return [{"error": f"PARSE_ERROR: duplicate result for series {series}"}] * size
+        responses[series - 1] = item
+
+    return [
+        item if item is not None else {"error": f"PARSE_ERROR: missing result for series {position}"}
+        for position, item in enumerate(responses, start=1)
+    ]
+
+
+def response_to_values(response: dict[str, Any], column_names: list[str]) -> dict[str, str]:
+    """Map a parsed response (or error) onto the requested output columns."""
+    if "error" in response:
+        return {name: response["error"] for name in column_names}
+
+    values = {}
+    for name in column_names:
+        value = response.get(name)
+        if isinstance(value, str) and value.strip():
+            values[name] = value.strip()
+        else:
+            values[name] = f"PARSE_ERROR: {response}"
+    return values
 
-    for idx, row in tqdm(rows.iterrows(), total=len(rows), desc="Querying Ollama"):
-        existing_values = [normalize_cell(row.get(col)) for col in column_names]
-        if not overwrite and all(existing_values):
-            continue
 
-        prompt = build_prompt(row, column_names, instruction)
-        response = query_ollama(prompt, model=model)
+def is_filled(value: str) -> bool:
+    """True for a real answer; blanks and error sentinels from an earlier run count as pending."""
+    value = value.strip()
+    return bool(value) and not value.startswith(ERROR_CODES)
 
-        if "error" in response:
-            for name in column_names:
-                df.at[idx, name] = response["error"]
-            continue
 
+async def process_rows(
+    rows: list[dict[str, str]],
+    column_names: list[str],
+    instruction: str,
+    model: str,
+    limit: int | None,
+    overwrite: bool,
+    write_row: Callable[[dict[str, str]], Any],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    url: str = DEFAULT_OLLAMA_URL,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    cache: sqlite3.Connection | None = None,
+    num_predict: int = DEFAULT_NUM_PREDICT,
+) -> None:
+    """Fill ``column_names`` for each row, passing rows to ``write_row`` in input order.
+
+    A row is handed off as soon as it and every row before it are complete, so
+    output streams to disk while later requests are still in flight. Every row is
+    written even if processing is interrupted; unfinished rows keep their input values.
+    """
+    for row in rows:
         for name in column_names:
-            value = response.get(name)
-            if isinstance(value, str) and value.strip():
-                df.at[idx, name] = value.strip()
-            else:
-                df.at[idx, name] = f"PARSE_ERROR: {response}"
+            row[name] = row.get(name) or ""
+
+    candidates = len(rows) if limit is None else min(limit, len(rows))
+    pending = [
+        position
+        for position in range(candidates)
+        if overwrite or not all(is_filled(rows[position][name]) for name in column_names)
+    ]
+
+    ready = [True] * len(rows)
+    for position in pending:
+        ready[position] = False
+    next_position = 0
+
+    def emit_ready() -> None:
+        nonlocal next_position
+        while next_position < len(rows) and ready[next_position]:
+            write_row(rows[next_position])
+            next_position += 1
+
+    # Each batch becomes one request; batches of one keep the single-series prompt.
+    batch_size = max(1, batch_size)
+    prefix = build_prompt_prefix(column_names, instruction)
+    batch_prefix = build_prompt_prefix(column_names, instruction, batched=True)
+    schema = build_response_schema(column_names)
+    batch_schema = build_response_schema(column_names, batched=True)
+    tasks = []
+    for start in range(0, len(pending), batch_size):
+        positions = pending[start : start + batch_size]
+        if len(positions) == 1:
+            prompt = build_prompt(rows[positions[0]], prefix)
+        else:
+            prompt = build_batch_prompt([rows[position] for position in positions], batch_prefix)
+        tasks.append((positions, prompt))
+
+    progress = tqdm(total=len(pending), desc="Querying Ollama")
+    emit_ready()
 
-    return df
+    try:
+        async with AsyncOllamaClient(model=model, url=url, concurrency=concurrency, cache=cache) as client:
+
+            async def run(positions: list[int], prompt: str) -> None:
+                # A batched prompt answers every series in one reply, so scale the token budget.
+                response = await client.generate(
+                    prompt,
+                    schema=schema if len(positions) == 1 else batch_schema,
+                    num_predict=num_predict * len(positions),
+                )
+                progress.update(len(positions))
+
+                responses = [response] if len(positions) == 1 else split_batch_response(response, len(positions))
+                for position, item in zip(positions, responses):
+                    rows[position].update(response_to_values(item, column_names))
+                    ready[position] = True
+                emit_ready()
+
+            await asyncio.gather(*(run(positions, prompt) for positions, prompt in tasks))
+    finally:
+        # On a crash or Ctrl-C, rows still in flight pass through with their input
+        # values, so the output is always complete and can be fed back in.
+        progress.close()
+        ready[:] = [True] * len(rows)
+        emit_ready()
 
 
 def parse_args() -> argparse.Namespace:
@@ -210,10 +348,47 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Re-query rows where the target column already has content.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum number of in-flight Ollama requests (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            "Number of series to bundle into a single prompt; values above 1 ask the model "
+            f"for a JSON array of results (default: {DEFAULT_BATCH_SIZE})"
+        ),
+    )
+    parser.add_argument(
+        "--num-predict",
+        type=int,
+        default=DEFAULT_NUM_PREDICT,
+        help=f"Maximum tokens generated per series (default: {DEFAULT_NUM_PREDICT})",
+    )
+    parser.add_argument(
+        "--ollama-url",
+        default=DEFAULT_OLLAMA_URL,
+        help=f"Ollama generate endpoint (default: {DEFAULT_OLLAMA_URL})",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_CACHE,
+        help=f"SQLite cache of Ollama responses keyed by model and prompt (default: {DEFAULT_CACHE})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query Ollama, bypassing the response cache.",
+    )
     return parser.parse_args()
 
 
-def main() -> None:
+async def main() -> None:
     args = parse_args()
     instruction = load_instruction(args.instruction, args.prompt_file)
 
@@ -221,8 +396,8 @@ def main() -> None:
         raise SystemExit(f"Input file not found: {args.input}")
 
     try:
-        df = pd.read_csv(args.input)
-    except Exception as exc:
+        fieldnames, rows = load_rows(args.input)
+    except (OSError, csv.Error, UnicodeDecodeError) as exc:
         raise SystemExit(f"Failed to read {args.input}: {exc}") from exc
 
     if args.columns:
@@ -232,28 +407,58 @@ def main() -> None:
     else:
         column_names = list(DEFAULT_COLUMNS)
 
-    processed_df = process_dataframe(
-        df=df,
-        column_names=column_names,
-        instruction=instruction,
-        model=args.model,
-        limit=args.limit,
-        overwrite=args.overwrite,
-    )
+    fieldnames += [name for name in column_names if name not in fieldnames]
 
     output_path = args.output
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    cache = None if args.no_cache else open_cache(args.cache)
+    # Write beside the target and swap it in at the end, so the output (which may be
+    # the input) is never left truncated.
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    written = 0
+
+    def write_row(row: dict[str, str]) -> None:
+        nonlocal written
+        writer.writerow(row)
+        written += 1
+
     try:
-        processed_df.to_csv(output_path, index=False)
-    except Exception as exc:
+        try:
+            with tmp_path.open("w", newline="", encoding="utf-8") as handle:
+                writer = csv.DictWriter(handle, fieldnames=fieldnames, extrasaction="ignore")
+                writer.writeheader()
+                await process_rows(
+                    rows=rows,
+                    column_names=column_names,
+                    instruction=instruction,
+                    model=args.model,
+                    limit=args.limit,
+                    overwrite=args.overwrite,
+                    write_row=write_row,
+                    concurrency=args.concurrency,
+                    url=args.ollama_url,
+                    batch_size=args.batch_size,
+                    cache=cache,
+                    num_predict=args.num_predict,
+                )
+        finally:
+            # A short file means the write itself failed; keep the previous output then.
+            if written == len(rows):
+                os.replace(tmp_path, output_path)
+            elif tmp_path.exists():
+                tmp_path.unlink()
+    except OSError as exc:
         raise SystemExit(f"Failed to write {output_path}: {exc}") from exc
+    finally:
+        if cache is not None:
+            cache.close()
 
-    print(f"Wrote {len(processed_df)} rows to {output_path}")
+    print(f"Wrote {len(rows)} rows to {output_path}")
 
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\nInterrupted by user.", file=sys.stderr)
         sys.exit(130)
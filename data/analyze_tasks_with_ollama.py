@@ -3,26 +3,28 @@
 Analyze task descriptions using Ollama to extract role, goal, and location/context
 """
 
+import asyncio
 import pandas as pd
 import json
-import subprocess
+import os
 from tqdm import tqdm
 import sys
 
-def query_ollama(task_description, model="llama3.2"):
-    """
-    Query Ollama to analyze a task description
+from llm_client import DEFAULT_CONCURRENCY, AsyncOllamaClient, error_code, open_cache
 
-    Args:
-        task_description: The task description to analyze
-        model: The Ollama model to use (default: llama3.2)
+DEFAULT_CACHE = 'ollama_cache.sqlite'
+OUTPUT_COLUMNS = ['role', 'goal', 'location', 'company_level', 'fred_category', 'user_intent', 'difficulty']
 
-    Returns:
-        dict with role, goal, and location keys
-    """
-    prompt = f"""Analyze this task description and extract the following information in JSON format:
+# JSON schema passed as Ollama's "format" so decoding can only produce these string fields
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "required": OUTPUT_COLUMNS,
+    "properties": {column: {"type": "string"} for column in OUTPUT_COLUMNS},
+}
 
-Task: "{task_description}"
+# Static instructions shared by every request; keeping them first and identical
+# lets Ollama reuse the cached prefix instead of re-running prefill per task.
+PROMPT_PREFIX = """Analyze the task description at the end of this prompt and extract the following information in JSON format:
 
 Please provide:
 1. "role": What job role or occupation is performing this task?
@@ -34,51 +36,80 @@ Please provide:
 7. "difficulty": Rate the difficulty level of this task. Choose from: Very Easy, Easy, Moderate, Hard, Very Hard, Expert.
 
 Respond ONLY with valid JSON in this exact format:
-{{"role": "...", "goal": "...", "location": "...", "company_level": "...", "fred_category": "...", "user_intent": "...", "difficulty": "..."}}"""
-
-    try:
-        # Call Ollama via subprocess
-        result = subprocess.run(
-            ['ollama', 'run', model],
-            input=prompt,
-            text=True,
-            capture_output=True,
-            timeout=30
-        )
+{"role": "...", "goal": "...", "location": "...", "company_level": "...", "fred_category": "...", "user_intent": "...", "difficulty": "..."}
+"""
+
+def build_prompt(task_description):
+    """
+    Build the analysis prompt for a task description
+
+    Args:
+        task_description: The task description to analyze
+
+    Returns:
+        Prompt text; row-specific text goes last so every request shares PROMPT_PREFIX verbatim
+    """
+    return f'{PROMPT_PREFIX}\n---\nTask: "{task_description}"'
 
-        if result.returncode != 0:
-            print(f"Error calling Ollama: {result.stderr}", file=sys.stderr)
-            return {"role": "ERROR", "goal": "ERROR", "location": "ERROR", "company_level": "ERROR", "fred_category": "ERROR", "user_intent": "ERROR", "difficulty": "ERROR"}
 
-        # Parse the JSON response
-        response_text = result.stdout.strip()
+def result_to_row(task_description, response):
+    """
+    Turn a client response into the output column values
 
-        # Try to find JSON in the response
-        # Sometimes the model adds extra text, so we look for the JSON object
-        start_idx = response_text.find('{')
-        end_idx = response_text.rfind('}') + 1
+    Args:
+        task_description: The task description that was analyzed
+        response: Parsed reply or error dict from AsyncOllamaClient
 
-        if start_idx != -1 and end_idx > start_idx:
-            json_str = response_text[start_idx:end_idx]
-            parsed = json.loads(json_str)
-            return parsed
-        else:
-            print(f"Could not find JSON in response: {response_text}", file=sys.stderr)
-            return {"role": "PARSE_ERROR", "goal": "PARSE_ERROR", "location": "PARSE_ERROR", "company_level": "PARSE_ERROR", "fred_category": "PARSE_ERROR", "user_intent": "PARSE_ERROR", "difficulty": "PARSE_ERROR"}
+    Returns:
+        dict with one value per OUTPUT_COLUMNS entry; errors fill every column with their code
+    """
+    code = error_code(response)
+    if code is None:
+        return response
 
-    except subprocess.TimeoutExpired:
+    if code == "TIMEOUT":
         print(f"Timeout querying Ollama for task: {task_description[:50]}...", file=sys.stderr)
-        return {"role": "TIMEOUT", "goal": "TIMEOUT", "location": "TIMEOUT", "company_level": "TIMEOUT", "fred_category": "TIMEOUT", "user_intent": "TIMEOUT", "difficulty": "TIMEOUT"}
-    except json.JSONDecodeError as e:
-        print(f"JSON parse error: {e}", file=sys.stderr)
-        print(f"Response was: {response_text}", file=sys.stderr)
-        return {"role": "JSON_ERROR", "goal": "JSON_ERROR", "location": "JSON_ERROR", "company_level": "JSON_ERROR", "fred_category": "JSON_ERROR", "user_intent": "JSON_ERROR", "difficulty": "JSON_ERROR"}
-    except Exception as e:
-        print(f"Unexpected error: {e}", file=sys.stderr)
-        return {"role": "ERROR", "goal": "ERROR", "location": "ERROR", "company_level": "ERROR", "fred_category": "ERROR", "user_intent": "ERROR", "difficulty": "ERROR"}
+    else:
+        print(f"Error analyzing task: {response['error']}", file=sys.stderr)
+    return {column: code for column in OUTPUT_COLUMNS}
 
 
-def process_csv_file(input_file, output_file, model="llama3.2", limit=None):
+def load_checkpoint(checkpoint_file):
+    """
+    Read the JSONL checkpoint written by process_csv_file
+
+    Args:
+        checkpoint_file: Path to the checkpoint file
+
+    Returns:
+        List of record dicts. A final line cut short by a crash (undecodable or
+        missing its newline) is dropped and truncated away, so appends resume on a
+        clean line boundary.
+    """
+    records = []
+    with open(checkpoint_file, 'rb+') as f:
+        lines = f.read().splitlines(keepends=True)
+        good_end = 0
+        for position, line in enumerate(lines):
+            last = position == len(lines) - 1
+            if not line.endswith(b'\n') and last:
+                break
+            try:
+                record = json.loads(line) if line.strip() else None
+            except json.JSONDecodeError:
+                if last:
+                    break
+                raise
+            if record is not None:
+                records.append(record)
+            good_end += len(line)
+        if good_end < sum(len(line) for line in lines):
+            print(f"Dropping incomplete final line of {checkpoint_file}", file=sys.stderr)
+            f.truncate(good_end)
+    return records
+
+
+async def process_csv_file(input_file, output_file, model="llama3.2", limit=None, concurrency=DEFAULT_CONCURRENCY, cache=None):
     """
     Process a CSV file with task descriptions
 
@@ -87,9 +118,11 @@ def process_csv_file(input_file, output_file, model="llama3.2", limit=None):
         output_file: Path to output CSV file
         model: Ollama model to use
         limit: Optional limit on number of rows to process (for testing)
+        concurrency: Maximum number of in-flight Ollama requests
+        cache: Optional sqlite3.Connection used to memoize Ollama responses
     """
     print(f"Reading {input_file}...")
-    df = pd.read_csv(input_file)
+    df = pd.read_csv(input_file, dtype={'task_name': 'string'})
 
     if limit:
         df = df.head(limit)
@@ -97,79 +130,125 @@ def process_csv_file(input_file, output_file, model="llama3.2", limit=None):
 
     print(f"Total tasks to process: {len(df)}")
 
-    # Initialize new columns
-    df['role'] = ''
-    df['goal'] = ''
-    df['location'] = ''
-    df['company_level'] = ''
-    df['fred_category'] = ''
-    df['user_intent'] = ''
-    df['difficulty'] = ''
-
-    # Process each task
-    for idx, row in tqdm(df.iterrows(), total=len(df), desc="Processing tasks"):
-        task_name = row['task_name']
-
-        # Query Ollama
-        result = query_ollama(task_name, model=model)
-
-        # Store results
-        df.at[idx, 'role'] = result.get('role', 'ERROR')
-        df.at[idx, 'goal'] = result.get('goal', 'ERROR')
-        df.at[idx, 'location'] = result.get('location', 'ERROR')
-        df.at[idx, 'company_level'] = result.get('company_level', 'ERROR')
-        df.at[idx, 'fred_category'] = result.get('fred_category', 'ERROR')
-        df.at[idx, 'user_intent'] = result.get('user_intent', 'ERROR')
-        df.at[idx, 'difficulty'] = result.get('difficulty', 'ERROR')
-
-        # Save intermediate results every 10 rows
-        if (idx + 1) % 10 == 0:
-            df.to_csv(output_file, index=False)
+    # Initialize new columns with a string dtype so bulk writes don't grow object columns
+    for column in OUTPUT_COLUMNS:
+        df[column] = pd.Series('', index=df.index, dtype='string')
+
+    # Results are buffered and written back in bulk instead of cell by cell
+    buffered = []
+
+    def flush():
+        if not buffered:
+            return
+        indices = [idx for idx, _ in buffered]
+        df.loc[indices, OUTPUT_COLUMNS] = [
+            [result.get(column, 'ERROR') for column in OUTPUT_COLUMNS] for _, result in buffered
+        ]
+        buffered.clear()
+
+    # Each finished row is appended to a JSONL checkpoint; rows already in it are
+    # restored on startup and skipped, so an interrupted run resumes where it stopped
+    checkpoint_file = os.path.splitext(output_file)[0] + '.checkpoint.jsonl'
+    done = set()
+    if os.path.exists(checkpoint_file) and os.path.getsize(checkpoint_file) > 0:
+        valid_indices = set(df.index)
+        for record in load_checkpoint(checkpoint_file):
+            idx = record.pop('idx')
+            if idx in valid_indices:
+                done.add(idx)
+                buffered.append((idx, record))
+        print(f"Resuming from {checkpoint_file}: {len(done)} tasks already done")
+
+    todo = [
+        (idx, task_name)
+        for idx, task_name in df[['task_name']].itertuples(index=True, name=None)
+        if idx not in done
+    ]
+
+    # Process tasks concurrently; Ollama batches in-flight requests on the loaded model
+    progress = tqdm(total=len(todo), desc="Processing tasks")
+
+    with open(checkpoint_file, 'a', encoding='utf-8', buffering=1 << 20) as checkpoint_out:
+
+        def on_result(position, response):
+            idx, task_name = todo[position]
+            result = result_to_row(task_name, response)
+            buffered.append((idx, result))
+            # Failed rows are left out of the checkpoint so a resumed run retries them
+            if error_code(response) is None:
+                checkpoint_out.write(json.dumps({"idx": int(idx), **result}) + "\n")
+            progress.update(1)
+
+            # Push the checkpoint to disk every 10 rows
+            if progress.n % 10 == 0:
+                checkpoint_out.flush()
+
+        async with AsyncOllamaClient(model=model, concurrency=concurrency, timeout=30, cache=cache) as client:
+            await client.generate_batch(
+                [build_prompt(task_name) for _, task_name in todo],
+                schema=RESPONSE_SCHEMA,
+                on_result=on_result,
+            )
+
+    progress.close()
+    flush()
 
     # Final save
     print(f"\nSaving results to {output_file}...")
     df.to_csv(output_file, index=False)
+    os.remove(checkpoint_file)
     print("Done!")
 
 
-def main():
+async def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='Analyze task descriptions using Ollama')
     parser.add_argument('--model', default='llama3.2', help='Ollama model to use')
     parser.add_argument('--limit', type=int, help='Limit number of rows to process (for testing)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Maximum number of in-flight Ollama requests')
+    parser.add_argument('--cache', default=DEFAULT_CACHE, help='SQLite cache of Ollama responses (default: ollama_cache.sqlite)')
+    parser.add_argument('--no-cache', action='store_true', help='Always query Ollama, bypassing the response cache')
     parser.add_argument('--v1', action='store_true', help='Process task_names_v1.csv')
     parser.add_argument('--v2', action='store_true', help='Process task_names_v2.csv')
     parser.add_argument('--both', action='store_true', help='Process both v1 and v2')
 
     args = parser.parse_args()
+    cache = None if args.no_cache else open_cache(args.cache)
 
     if args.both or args.v1:
         print("\n" + "="*60)
         print("Processing task_names_v1.csv")
         print("="*60)
-        process_csv_file(
+        await process_csv_file(
             'task_names_v1.csv',
             'task_names_v1_analyzed.csv',
             model=args.model,
-            limit=args.limit
+            limit=args.limit,
+            concurrency=args.concurrency,
+            cache=cache
         )
 
     if args.both or args.v2:
         print("\n" + "="*60)
         print("Processing task_names_v2.csv")
         print("="*60)
-        process_csv_file(
+        await process_csv_file(
             'task_names_v2.csv',
             'task_names_v2_analyzed.csv',
             model=args.model,
-            limit=args.limit
+            limit=args.limit,
+            concurrency=args.concurrency,
+            cache=cache
         )
 
     if not (args.v1 or args.v2 or args.both):
         parser.print_help()
         print("\nPlease specify --v1, --v2, or --both to process files")
 
+    if cache is not None:
+        cache.close()
+
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
@@ -0,0 +1,225 @@
+"""
+Shared async Ollama client for the analyze_tasks_* scripts.
+
+Owns the HTTP connection pool, the in-flight request limit, the SQLite response
+cache, and schema-constrained decoding so the scripts only build prompts and
+scatter results. Transient failures (timeouts, dropped connections, 429/5xx)
+are retried with exponential backoff; only once retries are exhausted is a
+failure returned, as ``{"error": "<CODE>: <detail>"}`` rather than raised, where
+CODE is one of TIMEOUT, OLLAMA_ERROR, JSON_ERROR or PARSE_ERROR.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import httpx
+
+DEFAULT_OLLAMA_URL = "http://localhost:11434/api/generate"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_NUM_PREDICT = 256
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_ATTEMPTS = 4
+# Every CODE an error response can carry; persisted cells starting with one mark a failed row.
+ERROR_CODES = ("TIMEOUT", "OLLAMA_ERROR", "JSON_ERROR", "PARSE_ERROR", "UNEXPECTED_ERROR")
+# Overload/unavailable responses worth retrying; other HTTP errors are terminal.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Low temperature keeps answers close to the requested JSON; num_predict caps decode length.
+GENERATION_OPTIONS = {"temperature": 0.2, "top_p": 0.9}
+
+
+def open_cache(path: Path | str) -> sqlite3.Connection:
+    """Open (or create) the SQLite response cache at ``path``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+    return conn
+
+
+def cache_key(prompt: str, model: str) -> str:
+    """Content-address a request by model and exact prompt text."""
+    return hashlib.blake2b(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def error_code(response: dict[str, Any]) -> str | None:
+    """Return the CODE part of an error response, or None for a successful one."""
+    error = response.get("error")
+    if not isinstance(error, str):
+        return None
+    return error.split(":", 1)[0]
+
+
+@dataclass
+class AsyncOllamaClient:
+    """Bounded-concurrency, cached client for Ollama's /api/generate endpoint.
+
+    Use as ``async with AsyncOllamaClient(model=...) as client:`` so the
+    underlying ``httpx.AsyncClient`` is opened once and closed afterwards.
+    """
+
+    model: str
+    url: str = DEFAULT_OLLAMA_URL
+    concurrency: int = DEFAULT_CONCURRENCY
+    timeout: float = DEFAULT_TIMEOUT
+    cache: sqlite3.Connection | None = None
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    http: httpx.AsyncClient | None = field(default=None, repr=False)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+    async def __aenter__(self) -> AsyncOllamaClient:
+        if self.http is None:
+            self.http = httpx.AsyncClient(timeout=self.timeout)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+
+    def _cache_get(self, key: str) -> dict[str, Any] | None:
+        if self.cache is None:
+            return None
+        row = self.cache.execute("SELECT response FROM cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def _cache_put(self, key: str, response: dict[str, Any]) -> None:
+        if self.cache is None:
+            return
+        self.cache.execute(
+            "INSERT OR REPLACE INTO cache (key, response) VALUES (?, ?)",
+            (key, json.dumps(response)),
+        )
+        self.cache.commit()
+
+    async def _post(self, payload: dict[str, Any]) -> str:
+        """Return the raw reply body; the envelope is validated by ``_request``."""
+        response = await self.http.post(self.url, json=payload)
+        response.raise_for_status()
+        return response.text
+
+    async def _request(
+        self,
+        prompt: str,
+        schema: dict[str, Any] | None,
+        num_predict: int,
+        temperature: float | None = None,
+    ) -> dict[str, Any]:
+        options = {**GENERATION_OPTIONS, "num_predict": num_predict}
+        if temperature is not None:
+            options["temperature"] = temperature
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": False,
+            "format": schema or "json",
+            "options": options,
+        }
+
+        attempts = max(1, self.max_attempts)
+        for attempt in range(1, attempts + 1):
+            final = attempt == attempts
+            try:
+                body_text = await self._post(payload)
+                break
+            except httpx.TimeoutException:
+                if final:
+                    return {"error": "TIMEOUT"}
+            except httpx.HTTPStatusError as exc:
+                if final or exc.response.status_code not in RETRY_STATUS_CODES:
+                    return {"error": f"OLLAMA_ERROR: {exc}"}
+            except httpx.TransportError as exc:
+                if final:
+                    return {"error": f"OLLAMA_ERROR: {exc}"}
+            except (httpx.HTTPError, ValueError) as exc:
+                return {"error": f"OLLAMA_ERROR: {exc}"}
+
+            await asyncio.sleep(min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+        # A proxy or error page can answer 200 with HTML or a non-object body.
+        try:
+            body = json.loads(body_text)
+        except json.JSONDecodeError as exc:
+            return {"error": f"JSON_ERROR: invalid Ollama reply: {exc}: {body_text[:200]}"}
+        response_text = (body.get("response") or "") if isinstance(body, dict) else None
+        if not isinstance(response_text, str):
+            return {"error": f"JSON_ERROR: unexpected Ollama reply: {body_text[:200]}"}
+        response_text = response_text.strip()
+
+        try:
+            parsed = json.loads(response_text)
+        except json.JSONDecodeError as exc:
+            return {"error": f"JSON_ERROR: {exc}: {response_text}"}
+
+        if not isinstance(parsed, dict):
+            return {"error": f"PARSE_ERROR: {response_text}"}
+        return parsed
+
+    async def generate(
+        self,
+        prompt: str,
+        schema: dict[str, Any] | None = None,
+        num_predict: int = DEFAULT_NUM_PREDICT,
+    ) -> dict[str, Any]:
+        """Return the parsed JSON reply for ``prompt``, from the cache when possible."""
+        key = cache_key(prompt, self.model)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        async with self._semaphore:
+            response = await self._request(prompt, schema, num_predict)
+            if error_code(response) == "JSON_ERROR":
+                # Usually a reply cut short mid-object; one greedy retry tends to fix it.
+                response = await self._request(prompt, schema, num_predict, temperature=0.0)
+
+        # Errors are not cached so a rerun retries them.
+        if "error" not in response:
+            self._cache_put(key, response)
+        return response
+
+    async def generate_batch(
+        self,
+        prompts: Iterable[str],
+        schema: dict[str, Any] | None = None,
+        num_predict: int = DEFAULT_NUM_PREDICT,
+        on_result: Callable[[int, dict[str, Any]], Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Generate replies for all ``prompts`` concurrently, preserving order.
+
+        ``on_result(position, response)`` is called as each reply arrives.
+        """
+
+        async def run(position: int, prompt: str) -> dict[str, Any]:
+            response = await self.generate(prompt, schema=schema, num_predict=num_predict)
+            if on_result is not None:
+                on_result(position, response)
+            return response
+
+        return list(await asyncio.gather(*(run(position, prompt) for position, prompt in enumerate(prompts))))
+
+
+async def generate_batch(
+    prompts: Iterable[str],
+    model: str,
+    schema: dict[str, Any] | None = None,
+    cache: sqlite3.Connection | None = None,
+    num_predict: int = DEFAULT_NUM_PREDICT,
+    **client_options: Any,
+) -> list[dict[str, Any]]:
+    """One-shot helper: open a client, generate replies for ``prompts``, close it."""
+    async with AsyncOllamaClient(model=model, cache=cache, **client_options) as client:
+        return await client.generate_batch(prompts, schema=schema, num_predict=num_predict)
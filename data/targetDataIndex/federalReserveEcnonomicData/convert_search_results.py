@@ -1,12 +1,70 @@
 #!/usr/bin/env python3
-"""Convert search_results/*.txt files to structured JSON format."""
+"""Convert search_results/*.txt files to structured JSON and/or Markdown in one pass."""
 
 from __future__ import annotations
 
+import io
 import json
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Compiled once; lines that do not start with a digit are rejected before matching.
+_SERIES_RE = re.compile(r"\d+\. ([A-Z0-9]+) - (.+)")
+_NUM_DOT_RE = re.compile(r"\d+\.")
+
+_TABLE_HEADER = (
+    "| ID | Title | Frequency | Units | Last Updated | Notes |",
+    "| --- | --- | --- | --- | --- | --- |",
+)
+_TABLE_FIELDS = ("series_id", "title", "frequency", "units", "last_updated", "notes")
+
+_HEADER_PREFIXES = ("FRED Series", "Query:", "Timestamp:", "Total Results:")
+
+# First word of a metadata line -> (full prefix, metadata field)
+_PREFIX_HANDLERS = {
+    "Units:": ("Units: ", "units"),
+    "Frequency:": ("Frequency: ", "frequency"),
+    "Last": ("Last Updated: ", "last_updated"),
+    "Notes:": ("Notes: ", "notes"),
+}
+
+
+def _starts_with_number(line: str) -> bool:
+    """Return True for lines beginning with an enumerator such as "12."."""
+    return line[:1].isdigit() and _NUM_DOT_RE.match(line) is not None
+
+
+def _dump_json(data: Dict[str, object]) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dump_json_line(data: Dict[str, object]) -> bytes:
+    """Serialize to one compact line of UTF-8 JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _read_lines(file_path: Path) -> List[str]:
+    """Return the stripped lines of a file, decoding each straight from a read-only mmap."""
+    with file_path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return []  # mmap cannot map an empty file
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return [line.decode("utf-8").strip() for line in iter(mapped.readline, b"")]
 
 
 def parse_search_result_file(file_path: Path) -> Dict[str, object]:
@@ -18,11 +76,10 @@ def parse_search_result_file(file_path: Path) -> Dict[str, object]:
     Returns:
         Dictionary with query and results list
     """
-    content = file_path.read_text(encoding="utf-8")
-    lines = content.strip().split("\n")
+    lines = _read_lines(file_path)
 
     if not lines:
-        return {"query": file_path.stem, "results": []}
+        return {"query": file_path.stem, "result_count": 0, "results": []}
 
     # Extract query from "Query: X" line
     query = file_path.stem  # default fallback
@@ -32,80 +89,73 @@ def parse_search_result_file(file_path: Path) -> Dict[str, object]:
             break
 
     results: List[Dict[str, str]] = []
+    line_count = len(lines)
     i = 0
 
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < line_count:
+        line = lines[i]
 
         # Skip empty lines and headers
-        if not line or line.startswith(("FRED Series", "Query:", "Timestamp:", "Total Results:")):
+        if not line or line.startswith(_HEADER_PREFIXES):
             i += 1
             continue
 
         # Parse series line: "1. SERIES_ID - Title"
-        match = re.match(r"\d+\. ([A-Z0-9]+) - (.+)", line)
-        if match:
-            series_id = match.group(1).strip()
-            title = match.group(2).strip()
-
-            # Parse metadata from following lines
-            metadata = {
-                "frequency": "",
-                "units": "",
-                "last_updated": "",
-                "notes": ""
-            }
-            
-            # Look ahead for metadata lines
-            j = i + 1
-            notes_lines = []
-            
-            while j < len(lines):
-                next_line = lines[j].strip()
-                
-                # Stop if we hit the next series or empty line followed by number
-                if not next_line:
-                    if j + 1 < len(lines) and re.match(r"\d+\.", lines[j + 1].strip()):
-                        break
-                    j += 1
-                    continue
-                
-                if re.match(r"\d+\.", next_line):
-                    break
-                    
-                # Parse specific metadata lines
-                if next_line.startswith("Units: "):
-                    metadata["units"] = next_line.replace("Units: ", "").strip()
-                elif next_line.startswith("Frequency: "):
-                    metadata["frequency"] = next_line.replace("Frequency: ", "").strip()
-                elif next_line.startswith("Last Updated: "):
-                    metadata["last_updated"] = next_line.replace("Last Updated: ", "").strip()
-                elif next_line.startswith("Notes: "):
-                    # Start collecting notes
-                    note_text = next_line.replace("Notes: ", "").strip()
-                    if note_text != "No description available":
-                        notes_lines.append(note_text)
-                else:
-                    # Continue collecting notes if we're in notes section
-                    if notes_lines or (j > i + 1 and "Notes:" in lines[j-1]):
-                        notes_lines.append(next_line)
-                
+        match = line[:1].isdigit() and _SERIES_RE.match(line)
+        if not match:
+            i += 1
+            continue
+
+        metadata = {
+            "frequency": "",
+            "units": "",
+            "last_updated": "",
+            "notes": "",
+        }
+        notes_lines: List[str] = []
+        after_notes = False  # previous line was a "Notes:" line
+
+        # Consume metadata lines until the next numbered series
+        j = i + 1
+        while j < line_count:
+            next_line = lines[j]
+
+            if not next_line:
+                after_notes = False
                 j += 1
-            
-            # Join notes
-            if notes_lines:
-                metadata["notes"] = " ".join(notes_lines).strip()
-
-            results.append({
-                "series_id": series_id,
-                "title": title,
+                continue
+
+            if _starts_with_number(next_line):
+                break
+
+            head = next_line.partition(" ")[0]
+            handler = _PREFIX_HANDLERS.get(head)
+            if handler is not None and next_line.startswith(handler[0]):
+                field = handler[1]
+                value = next_line[len(handler[0]):].strip()
+                if field != "notes":
+                    metadata[field] = value
+                elif value != "No description available":
+                    notes_lines.append(value)
+            elif notes_lines or after_notes:
+                # Continuation of a multi-line notes block
+                notes_lines.append(next_line)
+
+            after_notes = "Notes:" in next_line
+            j += 1
+
+        if notes_lines:
+            metadata["notes"] = " ".join(notes_lines).strip()
+
+        results.append(
+            {
+                "series_id": match.group(1).strip(),
+                "title": match.group(2).strip(),
                 **metadata,
-            })
-
-            i = j  # Skip to next series
-            continue
+            }
+        )
 
-        i += 1
+        i = j  # Skip to next series
 
     return {
         "query": query,
@@ -114,17 +164,75 @@ def parse_search_result_file(file_path: Path) -> Dict[str, object]:
     }
 
 
+def _escape_markdown(text: str) -> str:
+    """Escape pipe characters so Markdown tables render correctly."""
+    return text if "|" not in text else text.replace("|", "\\|")
+
+
+def _render_query_markdown(query: str, data: Dict[str, object]) -> str:
+    """Render a single query's data to Markdown."""
+    results = data["results"]
+    header = [f"## {query}", f"Total results: {data['result_count']}", ""]
+
+    if not results:
+        return "\n".join(header + ["_No series found._", ""])
+
+    # Header rows, one row per result, then a trailing blank line.
+    lines = [""] * (len(header) + len(_TABLE_HEADER) + len(results) + 1)
+    lines[: len(header)] = header
+    lines[len(header) : len(header) + len(_TABLE_HEADER)] = _TABLE_HEADER
+
+    escape = _escape_markdown
+    for row, item in enumerate(results, start=len(header) + len(_TABLE_HEADER)):
+        lines[row] = "| " + " | ".join(escape(item.get(field) or "") for field in _TABLE_FIELDS) + " |"
+
+    return "\n".join(lines)
+
+
+def _convert_file(
+    txt_file: Path,
+    individual_json: bool = False,
+    render_markdown: bool = False,
+    individual_markdown: bool = False,
+) -> Tuple[Dict[str, object], Optional[str]]:
+    """Parse one .txt file in a worker process and emit every requested format.
+
+    Returns the parsed data and, when render_markdown is set, its Markdown
+    section; per-query sidecar files are written here rather than in the parent.
+    """
+    data = parse_search_result_file(txt_file)
+    section = _render_query_markdown(data["query"], data) if render_markdown else None
+
+    if individual_json:
+        txt_file.with_suffix(".json").write_bytes(_dump_json(data))
+
+    if section is not None and individual_markdown:
+        txt_file.with_suffix(".md").write_text(
+            f"# FRED Search Results: {data['query']}\n\n{section}",
+            encoding="utf-8",
+        )
+
+    return data, section
+
+
 def convert_all_search_results(
     input_dir: Path,
-    output_file: Path,
+    output_file: Optional[Path],
     individual_json: bool = False,
+    markdown_file: Optional[Path] = None,
+    individual_markdown: bool = False,
 ) -> None:
-    """Convert all .txt files in input_dir to JSON.
+    """Convert all .txt files in input_dir to JSON and/or Markdown.
+
+    Each file is parsed once and the same parsed data feeds every output.
 
     Args:
         input_dir: Directory containing .txt search result files
-        output_file: Path for consolidated JSON output
+        output_file: Path for consolidated JSON output, or None to skip JSON; a
+            ``.jsonl`` suffix writes one ``{"query", "results", ...}`` object per line
         individual_json: If True, also create individual JSON files for each query
+        markdown_file: Path for consolidated Markdown output, or None to skip Markdown
+        individual_markdown: If True, also create individual Markdown files for each query
     """
     if not input_dir.exists():
         print(f"Error: Directory {input_dir} does not exist")
@@ -136,31 +244,51 @@ def convert_all_search_results(
         print(f"No .txt files found in {input_dir}")
         return
 
-    all_data = {}
+    emit_json = output_file is not None
+    emit_markdown = markdown_file is not None
+    individual_json = individual_json and emit_json
+    individual_markdown = individual_markdown and emit_markdown
 
-    for txt_file in txt_files:
-        print(f"Processing {txt_file.name}...")
-        data = parse_search_result_file(txt_file)
-        query = data["query"]
-        all_data[query] = data
-
-        # Optionally save individual JSON files
-        if individual_json:
-            json_file = txt_file.with_suffix(".json")
-            json_file.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
-            print(f"  → Created {json_file.name}")
-
-    # Save consolidated JSON
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(
-        json.dumps(all_data, indent=2, ensure_ascii=False),
-        encoding="utf-8",
+    all_data = {}
+    consolidated_markdown = io.StringIO()
+    consolidated_markdown.write("# FRED Search Results")
+
+    # Files are independent, so parse them across processes; map keeps input order.
+    worker = partial(
+        _convert_file,
+        individual_json=individual_json,
+        render_markdown=emit_markdown,
+        individual_markdown=individual_markdown,
     )
+    with ProcessPoolExecutor() as executor:
+        for txt_file, (data, section) in zip(txt_files, executor.map(worker, txt_files, chunksize=8)):
+            print(f"Processed {txt_file.name}")
+            all_data[data["query"]] = data
+
+            if section is not None:
+                consolidated_markdown.write("\n")
+                consolidated_markdown.write(section)
+
+            if individual_json:
+                print(f"  → Created {txt_file.with_suffix('.json').name}")
+            if individual_markdown:
+                print(f"  → Created {txt_file.with_suffix('.md').name}")
+
+    if emit_json:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        if output_file.suffix == ".jsonl":
+            # One query per line so readers can stream without loading everything.
+            with output_file.open("wb") as f:
+                f.writelines(_dump_json_line(data) for data in all_data.values())
+        else:
+            output_file.write_bytes(_dump_json(all_data))
+        print(f"\nConsolidated data written to {output_file}")
+
+    if emit_markdown:
+        markdown_file.parent.mkdir(parents=True, exist_ok=True)
+        markdown_file.write_text(consolidated_markdown.getvalue(), encoding="utf-8")
+        print(f"\nConsolidated markdown written to {markdown_file}")
 
-    print(f"\nConsolidated data written to {output_file}")
     print(f"Total queries: {len(all_data)}")
     print(f"Total series: {sum(len(d['results']) for d in all_data.values())}")
 
@@ -170,7 +298,7 @@ def main() -> None:
     import argparse
 
     parser = argparse.ArgumentParser(
-        description="Convert search_results/*.txt to structured JSON"
+        description="Convert search_results/*.txt to structured JSON and/or Markdown"
     )
     parser.add_argument(
         "--input-dir",
@@ -182,20 +310,37 @@ def main() -> None:
         "--output",
         type=Path,
         default=Path(__file__).parent / "search_results_consolidated.json",
-        help="Output path for consolidated JSON (default: ./search_results_consolidated.json)",
+        help="Output path for consolidated JSON; use a .jsonl suffix for JSON-lines "
+        "(default: ./search_results_consolidated.json)",
+    )
+    parser.add_argument(
+        "--markdown-output",
+        type=Path,
+        default=Path(__file__).parent / "search_results_consolidated.md",
+        help="Output path for consolidated Markdown (default: ./search_results_consolidated.md)",
+    )
+    parser.add_argument(
+        "--emit",
+        choices=("json", "md", "both"),
+        default="both",
+        help="Which formats to write from the single parse pass (default: both)",
     )
     parser.add_argument(
         "--individual",
         action="store_true",
-        help="Also create individual JSON files alongside each .txt file",
+        help="Also create individual files (per emitted format) alongside each .txt file",
     )
 
     args = parser.parse_args()
+    emit_json = args.emit in ("json", "both")
+    emit_markdown = args.emit in ("md", "both")
 
     convert_all_search_results(
         input_dir=args.input_dir,
-        output_file=args.output,
+        output_file=args.output if emit_json else None,
         individual_json=args.individual,
+        markdown_file=args.markdown_output if emit_markdown else None,
+        individual_markdown=args.individual,
     )
 
 
@@ -1,13 +1,23 @@
 #!/usr/bin/env python3
 """Example usage of the structured search results."""
 
-import json
 from pathlib import Path
 
-# Load consolidated data
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Load consolidated data (both parsers accept bytes, which skips a decode step)
 consolidated_file = Path(__file__).parent / "search_results_consolidated.json"
-with consolidated_file.open() as f:
-    all_searches = json.load(f)
+all_searches = _loads(consolidated_file.read_bytes())
 
 # Example 1: Get all series IDs for a specific query
 print("=== Example 1: All unemployment series IDs ===")
@@ -16,44 +26,50 @@ for result in unemployment_data.get("results", []):
     print(f"{result['series_id']}: {result['title']}")
 
 print("\n=== Example 2: Filter by frequency ===")
-# Get only monthly series across all queries
+# Transpose the results once into parallel columns shared by the next examples
+columns = {name: [] for name in ("query", "series_id", "title", "frequency", "units")}
 for query, data in all_searches.items():
-    monthly_series = [
-        r for r in data.get("results", [])
-        if r.get("frequency", "").startswith("Monthly")
-    ]
-    if monthly_series:
+    for result in data.get("results", ()):
+        columns["query"].append(query)
+        for name in ("series_id", "title", "frequency", "units"):
+            columns[name].append(result.get(name, ""))
+series_ids, titles, frequencies = columns["series_id"], columns["title"], columns["frequency"]
+
+# Get only monthly series across all queries: a NumPy mask when available, else a plain scan
+if np is not None:
+    monthly = np.flatnonzero(np.char.startswith(np.array(frequencies, dtype=str), "Monthly")).tolist()
+else:
+    monthly = [row for row, frequency in enumerate(frequencies) if frequency.startswith("Monthly")]
+# Apply the filter once, then bucket the surviving rows by query instead of re-masking per query
+query_column = columns["query"]
+monthly_by_query = {}
+for row in monthly:
+    monthly_by_query.setdefault(query_column[row], []).append(row)
+for query in all_searches:
+    monthly_rows = monthly_by_query.get(query)
+    if monthly_rows:
         print(f"\n{query.upper()} - Monthly series:")
-        for series in monthly_series[:3]:  # Just show first 3
-            print(f"  {series['series_id']}: {series['title']}")
+        for row in monthly_rows[:3]:  # Just show first 3
+            print(f"  {series_ids[row]}: {titles[row]}")
 
 print("\n=== Example 3: Create lookup dictionary ===")
-# Create a series_id -> info lookup
-series_lookup = {}
-for query, data in all_searches.items():
-    for result in data.get("results", []):
-        series_lookup[result["series_id"]] = {
-            "title": result["title"],
-            "frequency": result["frequency"],
-            "units": result["units"],
-            "query_category": query,
-        }
+# Create a series_id -> row index into the columns (later duplicates win)
+series_index = dict(zip(series_ids, range(len(series_ids))))
 
 # Look up a specific series
 series_id = "UNRATE"
-if series_id in series_lookup:
-    info = series_lookup[series_id]
+if series_id in series_index:
+    row = series_index[series_id]
     print(f"\nSeries {series_id}:")
-    print(f"  Title: {info['title']}")
-    print(f"  Frequency: {info['frequency']}")
-    print(f"  Units: {info['units']}")
-    print(f"  Category: {info['query_category']}")
+    print(f"  Title: {titles[row]}")
+    print(f"  Frequency: {frequencies[row]}")
+    print(f"  Units: {columns['units'][row]}")
+    print(f"  Category: {columns['query'][row]}")
 
 print("\n=== Example 4: Load individual JSON ===")
 # Or load a specific query's JSON file
 industry_file = Path(__file__).parent / "search_results" / "industry.json"
-with industry_file.open() as f:
-    industry_data = json.load(f)
+industry_data = _loads(industry_file.read_bytes())
 
 print(f"\nIndustry query returned {industry_data['result_count']} results")
 print(f"First result: {industry_data['results'][0]['series_id']}")
@@ -1,24 +1,66 @@
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import os
 import json
+import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dump_json(data):
+    """Serialize data as indented JSON bytes (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+FRED_SEARCH_URL = "https://api.stlouisfed.org/fred/series/search"
+# (connect, read) seconds
+REQUEST_TIMEOUT = (5, 30)
+# Query -> filename stem in one pass: lowercase ASCII letters, spaces to underscores
+_SAFE_NAME = str.maketrans({**{c: c.lower() for c in string.ascii_uppercase}, " ": "_"})
+
+def make_session():
+    """Pooled session that keeps the TLS connection to FRED alive and retries transient failures"""
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+    return session
+
+_SESSION = make_session()
+
 def search_fred_series(api_key, query, limit=20):
-    url = "https://api.stlouisfed.org/fred/series/search"
+    url = FRED_SEARCH_URL
     params = {
         "api_key": api_key,
         "search_text": query,
         "limit": limit,
         "file_type": "json"
     }
-    response = requests.get(url, params=params)
+    response = _SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT)
     response.raise_for_status()
     data = response.json()
     series = data.get("seriess", [])
     return series
 
+def search_many(api_key, queries, limit=20, max_workers=8):
+    """Run several searches concurrently over the shared session; returns {query: series}"""
+    queries = list(queries)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda query: search_fred_series(api_key, query, limit), queries)
+        return dict(zip(queries, results))
+
 def save_results(query, series, selected_series=None):
     """Save search results to search_results/ directory"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -26,8 +68,10 @@ def save_results(query, series, selected_series=None):
     # Ensure search_results directory exists
     os.makedirs("search_results", exist_ok=True)
     
+    safe_query = query.translate(_SAFE_NAME)
+
     # Save JSON results
-    json_filename = f"search_results/{query.lower().replace(' ', '_')}_{timestamp}.json"
+    json_filename = f"search_results/{safe_query}_{timestamp}.json"
     json_data = {
         "query": query,
         "timestamp": timestamp,
@@ -36,30 +80,35 @@ def save_results(query, series, selected_series=None):
         "selected_series": selected_series
     }
     
-    with open(json_filename, 'w') as f:
-        json.dump(json_data, f, indent=2)
+    with open(json_filename, 'wb') as f:
+        f.write(dump_json(json_data))
     
     # Save human-readable text results
-    txt_filename = f"search_results/{query.lower().replace(' ', '_')}_{timestamp}.txt"
-    with open(txt_filename, 'w') as f:
-        f.write(f"FRED Series Search Results\n")
-        f.write(f"Query: {query}\n")
-        f.write(f"Timestamp: {timestamp}\n")
-        f.write(f"Total Results: {len(series)}\n\n")
-        
-        for idx, s in enumerate(series):
-            f.write(f"{idx+1}. {s['id']} - {s['title']}\n")
-            f.write(f"   Notes: {s.get('notes', 'No description available')}\n")
-            f.write(f"   Units: {s.get('units', 'N/A')}\n")
-            f.write(f"   Frequency: {s.get('frequency', 'N/A')}\n")
-            f.write(f"   Last Updated: {s.get('last_updated', 'N/A')}\n\n")
-        
-        if selected_series:
-            f.write("\n" + "="*50 + "\n")
-            f.write("SELECTED SERIES:\n")
-            f.write(f"ID: {selected_series['id']}\n")
-            f.write(f"Title: {selected_series['title']}\n")
-            f.write(f"Description: {selected_series.get('notes', 'No description available')}\n")
+    txt_filename = f"search_results/{safe_query}_{timestamp}.txt"
+    lines = [
+        "FRED Series Search Results\n",
+        f"Query: {query}\n",
+        f"Timestamp: {timestamp}\n",
+        f"Total Results: {len(series)}\n\n",
+    ]
+    append = lines.append
+    for idx, s in enumerate(series, 1):
+        append(f"{idx}. {s['id']} - {s['title']}\n")
+        append(f"   Notes: {s.get('notes', 'No description available')}\n")
+        append(f"   Units: {s.get('units', 'N/A')}\n")
+        append(f"   Frequency: {s.get('frequency', 'N/A')}\n")
+        append(f"   Last Updated: {s.get('last_updated', 'N/A')}\n\n")
+
+    if selected_series:
+        append("\n" + "="*50 + "\n")
+        append("SELECTED SERIES:\n")
+        append(f"ID: {selected_series['id']}\n")
+        append(f"Title: {selected_series['title']}\n")
+        append(f"Description: {selected_series.get('notes', 'No description available')}\n")
+
+    # Build the report in memory and hand it to the OS in one write
+    with open(txt_filename, 'w', buffering=1 << 20) as f:
+        f.write("".join(lines))
     
     print(f"\n✅ Results saved to:")
     print(f"   📄 {txt_filename}")
@@ -2,29 +2,80 @@
 
 from __future__ import annotations
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import pandas as pd
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
 BASE_DIR = Path(__file__).parent
 CONSOLIDATED_RESULTS = BASE_DIR / "search_results_consolidated.json"
+CONSOLIDATED_RESULTS_JSONL = CONSOLIDATED_RESULTS.with_suffix(".jsonl")
 RAW_RESULTS_DIR = BASE_DIR / "search_results"
 OUTPUT_DIR = BASE_DIR / "ollama_pickup"
 OUTPUT_PATH = OUTPUT_DIR / "target_columns.csv"
+# File reads are latency-bound, so use more threads than cores.
+MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+CSV_BATCH_SIZE = 8192
+
+
+def load_json(path: str | os.PathLike):
+    """Parse a JSON file (any path-like, including ``os.DirEntry``) with orjson, or json without it."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Yield one parsed object per non-blank line, keeping a single query in memory at a time."""
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
 
+def load_search_results() -> dict | Iterable[dict]:
+    """Load consolidated search results; fallback to individual JSON files.
+
+    A JSON-lines consolidated file is used when the ``.json`` one is missing or
+    older, and is returned as a lazy iterator of per-query payloads rather than
+    a dict keyed by query.
+    """
+    if CONSOLIDATED_RESULTS_JSONL.exists() and (
+        not CONSOLIDATED_RESULTS.exists()
+        or CONSOLIDATED_RESULTS_JSONL.stat().st_mtime > CONSOLIDATED_RESULTS.stat().st_mtime
+    ):
+        return iter_jsonl(CONSOLIDATED_RESULTS_JSONL)
 
-def load_search_results() -> dict:
-    """Load consolidated search results; fallback to individual JSON files."""
     if CONSOLIDATED_RESULTS.exists():
-        return json.loads(CONSOLIDATED_RESULTS.read_text(encoding="utf-8"))
+        return load_json(CONSOLIDATED_RESULTS)
 
     data = {}
 
     if RAW_RESULTS_DIR.exists():
-        for json_file in sorted(RAW_RESULTS_DIR.glob("*.json")):
-            content = json.loads(json_file.read_text(encoding="utf-8"))
-            query_key = content.get("query") or json_file.stem
+        # One getdents pass; DirEntry caches the file type, so no per-file stat or Path objects.
+        with os.scandir(RAW_RESULTS_DIR) as it:
+            json_files = [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+        json_files.sort(key=lambda entry: entry.name)
+        # Read and parse concurrently; map() keeps the sorted order.
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            contents = list(executor.map(load_json, json_files))
+
+        for json_file, content in zip(json_files, contents):
+            query_key = content.get("query") or json_file.name[: -len(".json")]
 
             # Ensure a consistent list of result dictionaries.
             results = content.get("results")
@@ -57,49 +108,70 @@ def load_search_results() -> dict:
     )
 
 
-def build_dataframe(search_data: dict) -> pd.DataFrame:
-    """Flatten search result records into a DataFrame."""
-    records = []
+# Free-text fields copied through from each FRED result, stripped of padding.
+TEXT_COLUMNS = ["title", "frequency", "units", "last_updated", "notes"]
+OUTPUT_COLUMNS = ["task_name", "query", "series_id", *TEXT_COLUMNS]
+
+
+def _iter_payloads(search_data) -> Iterator[tuple]:
+    """Yield ``(query, payload)`` from a query-keyed mapping or a stream of payloads."""
+    if hasattr(search_data, "items"):
+        yield from search_data.items()
+    else:
+        for payload in search_data:
+            yield payload.get("query", ""), payload
+
 
-    for query, payload in search_data.items():
+def results_to_columns(search_data: dict | Iterable[dict]) -> dict[str, list]:
+    """Transpose the per-result dicts into parallel column lists in a single pass.
+
+    Missing fields become empty strings and ``series_id`` falls back to ``id``;
+    values are otherwise left as found (no stripping or filtering).
+    """
+    columns: dict[str, list] = {name: [] for name in ("query", "series_id", *TEXT_COLUMNS)}
+    append_query = columns["query"].append
+    append_series_id = columns["series_id"].append
+    text_appenders = [(name, columns[name].append) for name in TEXT_COLUMNS]
+
+    for query, payload in _iter_payloads(search_data):
         query_name = payload.get("query", query)
         for result in payload.get("results", []) or []:
-            series_id = result.get("series_id") or result.get("id")
-            title = result.get("title", "").strip()
-            if not series_id and not title:
-                continue
-
-            notes = (result.get("notes") or "").strip()
-            record = {
-                "task_name": f"FRED series {series_id}: {title}".strip()
-                if series_id
-                else title,
-                "query": query_name,
-                "series_id": series_id or "",
-                "title": title,
-                "frequency": (result.get("frequency") or "").strip(),
-                "units": (result.get("units") or "").strip(),
-                "last_updated": (result.get("last_updated") or "").strip(),
-                "notes": notes,
-            }
-            records.append(record)
-
-    df = pd.DataFrame.from_records(records)
-    if not df.empty:
-        # Ensure a consistent column order for downstream tooling.
-        df = df[
-            [
-                "task_name",
-                "query",
-                "series_id",
-                "title",
-                "frequency",
-                "units",
-                "last_updated",
-                "notes",
-            ]
-        ]
-    return df
+            append_query(query_name)
+            append_series_id(result.get("series_id") or result.get("id") or "")
+            for name, append in text_appenders:
+                append(result.get(name) or "")
+
+    return columns
+
+
+def build_dataframe(search_data: dict | Iterable[dict]) -> pd.DataFrame:
+    """Flatten search result records into a DataFrame."""
+    columns = results_to_columns(search_data)
+    if not columns["query"]:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(columns)
+    df["series_id"] = df["series_id"].astype(str)
+    # FRED fields are nearly always trimmed already; only rewrite the rows that are not.
+    padded = df[TEXT_COLUMNS].apply(lambda column: column.str.contains(r"^\s|\s$")).any(axis=1)
+    if padded.any():
+        df.loc[padded, TEXT_COLUMNS] = df.loc[padded, TEXT_COLUMNS].apply(lambda column: column.str.strip())
+
+    df = df[df["series_id"].ne("") | df["title"].ne("")]
+    labelled = ("FRED series " + df["series_id"] + ": " + df["title"]).str.strip()
+    df = df.assign(task_name=labelled.where(df["series_id"].ne(""), df["title"]))
+
+    # Ensure a consistent column order for downstream tooling.
+    return df[OUTPUT_COLUMNS].reset_index(drop=True)
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write ``df`` without its index, via Arrow's C++ CSV writer when pyarrow is installed."""
+    if pacsv is None:
+        df.to_csv(path, index=False)
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(batch_size=CSV_BATCH_SIZE))
 
 
 def main() -> None:
@@ -110,7 +182,7 @@ def main() -> None:
         raise ValueError("No search result records to write to CSV.")
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    df.to_csv(OUTPUT_PATH, index=False)
+    write_csv(df, OUTPUT_PATH)
     print(f"Wrote {len(df)} rows to {OUTPUT_PATH.relative_to(BASE_DIR)}")
 
 
@@ -1,26 +1,45 @@
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Tuple
 
 SRC_DIR = Path(__file__).resolve().parent / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.append(str(SRC_DIR))
 
-from models.production_functions import get_production_function, list_production_functions
+from models.production_functions import bind, get_production_function, list_production_functions
 
 try:
     import sympy as sp
 except ImportError:
     sp = None
 
+# The registry is immutable, so the CLI choices only need sorting once.
+_FUNCTION_CHOICES = tuple(sorted(list_production_functions()))
 
-def ai_adjusted_output(labor: float, capital: float, ai_factor: float, production_fn: Dict, params: Dict[str, float]) -> float:
+
+def make_evaluator(production_fn, params, ai_factor: float, vectorised: bool = False) -> Callable[[float, float], float]:
+    """
+    Bind the production function, its parameters and the AI multiplier once, returning
+    ``f(labor, capital)`` for repeated evaluation (e.g. parameter sweeps). Scalar-only
+    unless ``vectorised`` is set, in which case NumPy array inputs are accepted too.
+    """
+    base = bind(production_fn, params, vectorised=vectorised)
+
+    def evaluate(labor: float, capital: float) -> float:
+        return base(labor, capital) * ai_factor
+
+    return evaluate
+
+
+def ai_adjusted_output(labor: float, capital: float, ai_factor: float, production_fn, params: Tuple[float, ...]) -> float:
     """
     Evaluate the chosen production function and apply the AI multiplier.
+    ``params`` holds the parameter values in ``production_fn.param_names`` order; for
+    repeated evaluation use ``make_evaluator``, which binds them once.
     """
-    base_output = production_fn["numeric"](labor, capital, params)
-    return base_output * ai_factor
+    return production_fn.numeric(labor, capital, *params) * ai_factor
 
 
 def parse_param_overrides(pairs):
@@ -43,7 +62,20 @@ def apply_named_overrides(params: Dict[str, float], **overrides):
         params[key] = value
 
 
-def print_production_steps(function_name: str, production_fn: Dict, labor: float, capital: float, ai_factor: float, params: Dict[str, float]):
+@lru_cache(maxsize=None)
+def _compiled_production_function(function_name: str):
+    """
+    Build the symbolic form of a production function once per session, along with a
+    lambdified ``f(L, K, *params)`` for fast numeric evaluation.
+    """
+    L, K = sp.symbols("L K", positive=True)
+    symbolic_info = get_production_function(function_name).symbolic(sp, L, K)
+    param_symbols = tuple(symbolic_info["symbols"].values())
+    f_numeric = sp.lambdify((L, K) + param_symbols, symbolic_info["expr"], modules="math")
+    return L, K, symbolic_info, f_numeric
+
+
+def print_production_steps(function_name: str, labor: float, capital: float, ai_factor: float, params: Dict[str, float]):
     """
     Show symbolic steps for the chosen production function when SymPy is available.
     """
@@ -53,9 +85,8 @@ def print_production_steps(function_name: str, production_fn: Dict, labor: float
 
     sp.init_printing(use_unicode=False)
 
-    L, K = sp.symbols("L K", positive=True)
+    L, K, symbolic_info, f_numeric = _compiled_production_function(function_name)
     Q = sp.symbols("Q")
-    symbolic_info = production_fn["symbolic"](sp, L, K)
     base_expr = sp.Eq(Q, symbolic_info["expr"])
 
     print(f"{function_name.replace('_', ' ').title()} production function:")
@@ -73,7 +104,7 @@ def print_production_steps(function_name: str, production_fn: Dict, labor: float
     print("\nAfter substituting inputs and parameters:")
     sp.pprint(base_numeric_expr, use_unicode=False)
 
-    base_value = sp.N(base_numeric_expr.rhs)
+    base_value = f_numeric(labor, capital, *(params[name] for name in symbolic_info["symbols"]))
     print(f"\nBase output (numeric): {base_value}")
 
     Q_ai = sp.symbols("Q_AI")
@@ -87,26 +118,26 @@ def print_production_steps(function_name: str, production_fn: Dict, labor: float
     print("\nAfter substituting inputs, parameters, and AI factor:")
     sp.pprint(ai_numeric_expr, use_unicode=False)
 
-    ai_value = sp.N(ai_numeric_expr.rhs)
+    ai_value = ai_factor * base_value
     print(f"\nAI-transformed output (numeric): {ai_value}")
 
 
 def print_available_functions():
     registry = list_production_functions()
     print("Available production functions:\n")
-    for name, details in sorted(registry.items()):
-        print(f"- {name}: {details['description']}")
-        defaults = ", ".join(f"{key}={value}" for key, value in details["defaults"].items())
+    for name in _FUNCTION_CHOICES:
+        details = registry[name]
+        print(f"- {name}: {details.description}")
+        defaults = ", ".join(f"{key}={value}" for key, value in details.defaults_tuple)
         print(f"  Defaults: {defaults}")
-        docs = details.get("param_docs", {})
+        docs = details.param_docs
         if docs:
-            for param, doc in docs.items():
+            for param, doc in docs:
                 print(f"    {param}: {doc}")
         print()
 
 
 def parse_args():
-    function_choices = sorted(list_production_functions().keys())
     parser = argparse.ArgumentParser(
         description="Evaluate production functions with an optional AI multiplier.",
     )
@@ -120,7 +151,7 @@ def parse_args():
     )
     parser.add_argument(
         "--function",
-        choices=function_choices,
+        choices=_FUNCTION_CHOICES,
         default="cobb_douglas",
         help="Production function to evaluate.",
     )
@@ -155,7 +186,7 @@ def main():
         return
 
     production_fn = get_production_function(args.function)
-    params = production_fn["defaults"].copy()
+    params = production_fn.defaults
 
     apply_named_overrides(
         params,
@@ -170,25 +201,19 @@ def main():
         print(f"Parameter error: {error}")
         sys.exit(1)
 
-    missing_keys = [key for key in production_fn["defaults"].keys() if key not in params]
+    missing_keys = [key for key in production_fn.param_names if key not in params]
     if missing_keys:
         print(f"Missing parameters for {args.function}: {', '.join(missing_keys)}")
         sys.exit(1)
 
-    output = ai_adjusted_output(
-        args.labor,
-        args.capital,
-        args.ai_factor,
-        production_fn,
-        params,
-    )
+    evaluate = make_evaluator(production_fn, params, args.ai_factor)
+    output = evaluate(args.labor, args.capital)
     print(f"AI-adjusted output: {output}")
 
     if args.show_steps:
         print()
         print_production_steps(
             args.function,
-            production_fn,
             args.labor,
             args.capital,
             args.ai_factor,
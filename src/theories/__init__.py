@@ -1,8 +1,10 @@
 from .cobbDouglas import CobbDouglas, cobb_douglas
-from .production_functions import get_production_function, list_production_functions
+from .production_functions import ProductionFunctionSpec, bind, get_production_function, list_production_functions
 
 __all__ = [
     "CobbDouglas",
+    "ProductionFunctionSpec",
+    "bind",
     "cobb_douglas",
     "get_production_function",
     "list_production_functions",
@@ -1,9 +1,11 @@
 def cobb_douglas(X, Y, alpha, beta, A=1.0):
-    """Compute Cobb-Douglas output for two inputs."""
+    """Compute Cobb-Douglas output for two inputs; NumPy arrays broadcast elementwise."""
     return A * (X ** alpha) * (Y ** beta)
 
 
 class CobbDouglas:
+    __slots__ = ("A", "alpha", "beta")
+
     def __init__(self, A, alpha, beta):
         """
         Initialize Cobb-Douglas production function parameters.
@@ -22,4 +24,4 @@ class CobbDouglas:
         :param Y: Input Y (e.g., capital)
         :return: Output Q
         """
-        return self.A * (X ** self.alpha) * (Y ** self.beta)
+        return cobb_douglas(X, Y, self.alpha, self.beta, A=self.A)
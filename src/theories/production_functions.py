@@ -1,11 +1,71 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
-from .cobbDouglas import cobb_douglas as cobb_douglas_numeric
+from .cobbDouglas import cobb_douglas
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-ProductionFunction = Dict[str, Any]
+# isinstance(x, ()) is always False, so the array check stays a single call without NumPy.
+_ndarray = np.ndarray if np is not None else ()
+
+
+@dataclass(frozen=True, slots=True)
+class ProductionFunctionSpec:
+    """Immutable registry entry; ``numeric(labor, capital, *values)`` takes params in ``param_names`` order."""
+
+    numeric: Callable[..., float]
+    symbolic: Callable[..., Dict[str, Any]]
+    defaults_tuple: Tuple[Tuple[str, float], ...]
+    param_docs: Tuple[Tuple[str, str], ...]
+    description: str
+    param_names: Tuple[str, ...] = field(init=False)
+    # Key into ``_array_kernels()`` for the Numba kernel ``(labor[:], capital[:], *values, out[:])``.
+    kernel_name: Optional[str] = None
+    # ``binder(*values)`` -> scalar ``f(labor, capital)`` with the params unpacked into closure cells.
+    binder: Optional[Callable[..., Callable[[float, float], float]]] = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "param_names", tuple(name for name, _ in self.defaults_tuple))
+
+    @property
+    def defaults(self) -> Dict[str, float]:
+        """Fresh, mutable copy of the default parameters."""
+        return dict(self.defaults_tuple)
+
+    def param_values(self, params: Mapping[str, float]) -> Tuple[float, ...]:
+        """Order ``params`` positionally for ``numeric``."""
+        return tuple(params[name] for name in self.param_names)
+
+    def evaluate_many(self, labor, capital, values: Tuple[float, ...]):
+        """Evaluate over arrays of inputs, using the parallel JIT kernel when available."""
+        kernel = _array_kernels().get(self.kernel_name)
+        if kernel is None:
+            return self.numeric(labor, capital, *values)
+        labor, capital = np.broadcast_arrays(np.asarray(labor, dtype=np.float64), np.asarray(capital, dtype=np.float64))
+        out = np.empty(labor.size, dtype=np.float64)
+        kernel(labor.ravel(), capital.ravel(), *(float(value) for value in values), out)
+        return out.reshape(labor.shape)
+
+
+ProductionFunction = ProductionFunctionSpec
+
+
+def cobb_douglas_numeric(
+    labor: float, capital: float, A: float = 1.0, alpha: float = 0.3, beta: float = 0.7
+) -> float:
+    return cobb_douglas(labor, capital, alpha, beta, A=A)
+
+
+def _bind_cobb_douglas(A: float, alpha: float, beta: float) -> Callable[[float, float], float]:
+    # partial is implemented in C, so the bound call adds no Python frame over cobb_douglas itself.
+    return partial(cobb_douglas, alpha=alpha, beta=beta, A=A)
 
 
 def cobb_douglas_symbolic(sp_module, L, K):
@@ -18,15 +78,21 @@ def cobb_douglas_symbolic(sp_module, L, K):
     }
 
 
-def ces_numeric(labor: float, capital: float, params: Dict[str, float]) -> float:
-    A = params.get("A", 1.0)
-    delta = params.get("delta", 0.5)
-    rho = params.get("rho", -0.5)
-
+def ces_numeric(labor: float, capital: float, A: float = 1.0, delta: float = 0.5, rho: float = -0.5) -> float:
+    # ``**`` dispatches to np.power for arrays, so one expression serves both.
     inside = delta * (labor ** rho) + (1.0 - delta) * (capital ** rho)
     return A * (inside ** (1.0 / rho))
 
 
+def _bind_ces(A: float, delta: float, rho: float) -> Callable[[float, float], float]:
+    share, exponent = 1.0 - delta, 1.0 / rho
+
+    def evaluate(labor: float, capital: float) -> float:
+        return A * (delta * labor ** rho + share * capital ** rho) ** exponent
+
+    return evaluate
+
+
 def ces_symbolic(sp_module, L, K):
     A_sym, delta_sym, rho_sym = sp_module.symbols("A delta rho", positive=True)
     expr = A_sym * (delta_sym * L ** rho_sym + (1 - delta_sym) * K ** rho_sym) ** (1 / rho_sym)
@@ -37,13 +103,21 @@ def ces_symbolic(sp_module, L, K):
     }
 
 
-def leontief_numeric(labor: float, capital: float, params: Dict[str, float]) -> float:
-    A = params.get("A", 1.0)
-    a_coef = params.get("a_coef", 1.0)
-    b_coef = params.get("b_coef", 1.0)
+def leontief_numeric(
+    labor: float, capital: float, A: float = 1.0, a_coef: float = 1.0, b_coef: float = 1.0
+) -> float:
+    if isinstance(labor, _ndarray) or isinstance(capital, _ndarray):
+        return A * np.minimum(labor / a_coef, capital / b_coef)
     return A * min(labor / a_coef, capital / b_coef)
 
 
+def _bind_leontief(A: float, a_coef: float, b_coef: float) -> Callable[[float, float], float]:
+    def evaluate(labor: float, capital: float) -> float:
+        return A * min(labor / a_coef, capital / b_coef)
+
+    return evaluate
+
+
 def leontief_symbolic(sp_module, L, K):
     A_sym, a_sym, b_sym = sp_module.symbols("A a_coef b_coef", positive=True)
     expr = A_sym * sp_module.Min(L / a_sym, K / b_sym)
@@ -54,46 +128,92 @@ def leontief_symbolic(sp_module, L, K):
     }
 
 
-_PRODUCTION_FUNCTIONS: Dict[str, ProductionFunction] = {
-    "cobb_douglas": {
-        "numeric": lambda labor, capital, params: cobb_douglas_numeric(
-            labor, capital, params.get("alpha", 0.3), params.get("beta", 0.7), A=params.get("A", 1.0)
+@lru_cache(maxsize=None)
+def _array_kernels() -> Dict[str, Callable[..., None]]:
+    """Import Numba and JIT the array kernels on first use; empty when Numba is not installed.
+
+    Numba costs a few hundred milliseconds to import, so ``import theories`` never pays for it.
+    """
+    try:
+        import numba
+    except ImportError:
+        return {}
+
+    @numba.njit(cache=True, fastmath=True)
+    def _cobb_douglas_kernel(L, K, A, alpha, beta):
+        return A * L ** alpha * K ** beta
+
+    @numba.njit(cache=True, fastmath=True)
+    def _ces_kernel(L, K, A, delta, rho):
+        return A * (delta * L ** rho + (1.0 - delta) * K ** rho) ** (1.0 / rho)
+
+    @numba.njit(cache=True, fastmath=True)
+    def _leontief_kernel(L, K, A, a_coef, b_coef):
+        return A * min(L / a_coef, K / b_coef)
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _cobb_douglas_array(labor, capital, A, alpha, beta, out):
+        for i in numba.prange(labor.shape[0]):
+            out[i] = _cobb_douglas_kernel(labor[i], capital[i], A, alpha, beta)
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _ces_array(labor, capital, A, delta, rho, out):
+        for i in numba.prange(labor.shape[0]):
+            out[i] = _ces_kernel(labor[i], capital[i], A, delta, rho)
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _leontief_array(labor, capital, A, a_coef, b_coef, out):
+        for i in numba.prange(labor.shape[0]):
+            out[i] = _leontief_kernel(labor[i], capital[i], A, a_coef, b_coef)
+
+    return {"cobb_douglas": _cobb_douglas_array, "ces": _ces_array, "leontief": _leontief_array}
+
+
+_PRODUCTION_FUNCTIONS: Dict[str, ProductionFunctionSpec] = {
+    "cobb_douglas": ProductionFunctionSpec(
+        numeric=cobb_douglas_numeric,
+        symbolic=cobb_douglas_symbolic,
+        kernel_name="cobb_douglas",
+        binder=_bind_cobb_douglas,
+        defaults_tuple=(("A", 1.0), ("alpha", 0.3), ("beta", 0.7)),
+        param_docs=(
+            ("A", "Total factor productivity"),
+            ("alpha", "Output elasticity of labor"),
+            ("beta", "Output elasticity of capital"),
         ),
-        "symbolic": cobb_douglas_symbolic,
-        "defaults": {"A": 1.0, "alpha": 0.3, "beta": 0.7},
-        "param_docs": {
-            "A": "Total factor productivity",
-            "alpha": "Output elasticity of labor",
-            "beta": "Output elasticity of capital",
-        },
-        "description": "Cobb-Douglas production function with constant elasticities.",
-    },
-    "ces": {
-        "numeric": ces_numeric,
-        "symbolic": ces_symbolic,
-        "defaults": {"A": 1.0, "delta": 0.5, "rho": -0.5},
-        "param_docs": {
-            "A": "Scaling factor",
-            "delta": "Share parameter (labor weight)",
-            "rho": "Substitution parameter (rho != 0)",
-        },
-        "description": "Constant elasticity of substitution (CES) production function.",
-    },
-    "leontief": {
-        "numeric": leontief_numeric,
-        "symbolic": leontief_symbolic,
-        "defaults": {"A": 1.0, "a_coef": 1.0, "b_coef": 1.0},
-        "param_docs": {
-            "A": "Scaling factor",
-            "a_coef": "Labor requirement per unit of output",
-            "b_coef": "Capital requirement per unit of output",
-        },
-        "description": "Leontief (perfect complements) production function.",
-    },
+        description="Cobb-Douglas production function with constant elasticities.",
+    ),
+    "ces": ProductionFunctionSpec(
+        numeric=ces_numeric,
+        symbolic=ces_symbolic,
+        kernel_name="ces",
+        binder=_bind_ces,
+        defaults_tuple=(("A", 1.0), ("delta", 0.5), ("rho", -0.5)),
+        param_docs=(
+            ("A", "Scaling factor"),
+            ("delta", "Share parameter (labor weight)"),
+            ("rho", "Substitution parameter (rho != 0)"),
+        ),
+        description="Constant elasticity of substitution (CES) production function.",
+    ),
+    "leontief": ProductionFunctionSpec(
+        numeric=leontief_numeric,
+        symbolic=leontief_symbolic,
+        kernel_name="leontief",
+        binder=_bind_leontief,
+        defaults_tuple=(("A", 1.0), ("a_coef", 1.0), ("b_coef", 1.0)),
+        param_docs=(
+            ("A", "Scaling factor"),
+            ("a_coef", "Labor requirement per unit of output"),
+            ("b_coef", "Capital requirement per unit of output"),
+        ),
+        description="Leontief (perfect complements) production function.",
+    ),
 }
+_REGISTRY = MappingProxyType(_PRODUCTION_FUNCTIONS)
 
 
-def get_production_function(name: str) -> ProductionFunction:
+def get_production_function(name: str) -> ProductionFunctionSpec:
     normalized = name.lower()
     if normalized not in _PRODUCTION_FUNCTIONS:
         available = ", ".join(sorted(_PRODUCTION_FUNCTIONS.keys()))
@@ -101,5 +221,27 @@ def get_production_function(name: str) -> ProductionFunction:
     return _PRODUCTION_FUNCTIONS[normalized]
 
 
-def list_production_functions() -> Dict[str, ProductionFunction]:
-    return {name: data.copy() for name, data in _PRODUCTION_FUNCTIONS.items()}
+def bind(
+    production_fn: ProductionFunctionSpec,
+    params: Mapping[str, float] | Tuple[float, ...],
+    vectorised: bool = False,
+) -> Callable[[float, float], float]:
+    """Resolve ``params`` (by name, or already in ``param_names`` order) once and return ``f(labor, capital)``.
+
+    The default closure is a plain scalar expression with no per-call type checks;
+    pass ``vectorised=True`` to get one that also accepts NumPy arrays.
+    """
+    values = production_fn.param_values(params) if isinstance(params, Mapping) else tuple(params)
+    if not vectorised and production_fn.binder is not None:
+        return production_fn.binder(*values)
+    numeric = production_fn.numeric
+
+    def evaluate(labor: float, capital: float) -> float:
+        return numeric(labor, capital, *values)
+
+    return evaluate
+
+
+def list_production_functions() -> Mapping[str, ProductionFunctionSpec]:
+    """Read-only view of the registry; entries are frozen, so nothing is copied."""
+    return _REGISTRY